@@ -1,21 +1,19 @@
-import json
 import math
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
+import numpy as np
 from matplotlib.gridspec import GridSpec
 
+import econ_axes
+import econ_data
+import econ_shard
+
 # ── Load data ──────────────────────────────────────────────
-with open('../data/data.json') as f:
-    raw = json.load(f)
+table = econ_data.load_views('../data/data.json', is_summary=False)
 
-years = raw['years']
-data = raw['data']
-langs = sorted(
-    [d for d in data if not d['is_summary']],
-    key=lambda x: x['total'], reverse=True
-)
+years = table.years
+order = np.argsort(-table.total, kind='stable')
 
 lang_names = {
     'en': 'English', 'es': 'Spanish', 'de': 'German', 'ru': 'Russian',
@@ -87,11 +85,7 @@ lang_names = {
 def get_name(code):
     return lang_names.get(code, code.upper())
 
-def fmt(val):
-    if val >= 1e9:   return f'{val/1e9:.1f}B'
-    if val >= 1e6:   return f'{val/1e6:.0f}M'
-    if val >= 1e3:   return f'{val/1e3:.0f}K'
-    return str(int(val))
+fmt = econ_axes.fmt
 
 # ── Economist palette ──────────────────────────────────────
 ECON_RED     = '#E3120B'
@@ -131,98 +125,124 @@ plt.rcParams.update({
 per_page = 25
 ncols = 5
 nrows = 5
-total_pages = math.ceil(len(langs) / per_page)
+total_pages = math.ceil(len(order) / per_page)
+
+# Per-language peaks in rank order; each page's y ticks come from these
+peaks = table.views.max(axis=1)[order]
+
+# ── Page template ──────────────────────────────────────────
+# One figure is built and reused for every page: only the data, titles and
+# y ticks change, and matplotlib's text-extent cache (keyed on the renderer)
+# carries over from page to page.
+fig = plt.figure(figsize=(22, 30), facecolor=ECON_BG)
+fig.subplots_adjust(left=0.04, right=0.97, top=0.90, bottom=0.04, hspace=0.55, wspace=0.28)
+
+fig.patches.append(plt.Rectangle(
+    (0.04, 0.965), 0.93, 0.006,
+    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+))
+
+fig.text(0.04, 0.955, 'Wikipedia medical articles',
+         fontsize=28, fontweight='bold', fontfamily=title_font,
+         color=ECON_DARK, va='top')
+subtitle = fig.text(0.04, 0.935, '',
+                    fontsize=16, color=ECON_GREY, fontfamily=body_font, va='top')
+rank_line = fig.text(0.04, 0.920, '',
+                     fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
+
+gs = GridSpec(nrows, ncols, figure=fig,
+             left=0.04, right=0.97, top=0.86, bottom=0.06,
+             hspace=0.85, wspace=0.30)
+
+panels = []
+for idx in range(per_page):
+    ax = fig.add_subplot(gs[idx // ncols, idx % ncols])
+
+    # ── Red top rule per panel ──
+    ax_pos = ax.get_position()
+    rule = plt.Rectangle(
+        (ax_pos.x0, ax_pos.y1 + 0.018), ax_pos.width, 0.0025,
+        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+    )
+    fig.patches.append(rule)
 
-for page in range(total_pages):
-    start = page * per_page
-    end = min(start + per_page, len(langs))
-    page_langs = langs[start:end]
-    actual_count = len(page_langs)
+    # ── Total annotation ──
+    total_text = ax.text(0.98, 0.95, '',
+                         transform=ax.transAxes, fontsize=7.5, color=ECON_GREY,
+                         ha='right', va='top', fontfamily=body_font)
 
-    fig = plt.figure(figsize=(22, 30), facecolor=ECON_BG)
-    fig.subplots_adjust(left=0.04, right=0.97, top=0.90, bottom=0.04, hspace=0.55, wspace=0.28)
+    econ_axes.style_small_multiple(ax, ECON_LIGHT)
+    panels.append({'ax': ax, 'rule': rule, 'total': total_text, 'data': []})
 
-    # ── Header ─────────────────────────────────────────────
-    fig.patches.append(plt.Rectangle(
-        (0.04, 0.965), 0.93, 0.006,
-        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-    ))
+fig.text(0.04, 0.018,
+         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · Users-agents data',
+         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
+page_no = fig.text(0.97, 0.018, '',
+                   fontsize=9, color='#AAAAAA', fontfamily=body_font, va='bottom',
+                   ha='right', style='italic')
+
+
+def render_page(page, outpath):
+    start = page * per_page
+    end = min(start + per_page, len(order))
+    y_lims, y_ticks, y_labels = econ_axes.nice_ticks(peaks[start:end])
 
-    fig.text(0.04, 0.955, 'Wikipedia medical articles',
-             fontsize=28, fontweight='bold', fontfamily=title_font,
-             color=ECON_DARK, va='top')
-    fig.text(0.04, 0.935, f'User views by language, 2016–25*   ·   Page {page+1} of {total_pages}',
-             fontsize=16, color=ECON_GREY, fontfamily=body_font, va='top')
+    # ── Header ─────────────────────────────────────────────
+    subtitle.set_text(f'User views by language, 2016–25*   ·   Page {page+1} of {total_pages}')
     rank_range = f'Ranked #{start+1}–{end} by total views'
-    fig.text(0.04, 0.920, f'{rank_range}  |  *2025 figure is year-to-date',
-             fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
-
-    # ── Grid ───────────────────────────────────────────────
-    gs = GridSpec(nrows, ncols, figure=fig,
-                 left=0.04, right=0.97, top=0.86, bottom=0.06,
-                 hspace=0.85, wspace=0.30)
-
-    for idx in range(actual_count):
-        lang = page_langs[idx]
-        row = idx // ncols
-        col = idx % ncols
-        ax = fig.add_subplot(gs[row, col])
-
-        views = [lang[str(y)] for y in years]
-        name  = get_name(lang['lang'])
+    rank_line.set_text(f'{rank_range}  |  *2025 figure is year-to-date')
+    page_no.set_text(f'Page {page+1}/{total_pages}')
+
+    for idx, panel in enumerate(panels):
+        ax = panel['ax']
+        for artist in panel['data']:
+            artist.remove()
+        panel['data'] = []
+
+        # Short last page: hide the unused panels
+        used = start + idx < end
+        ax.set_visible(used)
+        panel['rule'].set_visible(used)
+        if not used:
+            continue
+
+        i = start + idx
+        row = order[i]
+        views = table.views[row].tolist()
+        name  = get_name(table.lang[row])
         peak  = max(views)
         peak_yr = years[views.index(peak)]
-        rank = start + idx + 1
+        rank = i + 1
 
         # ── Area fill + line ──
-        ax.fill_between(years, views, alpha=0.12, color=ECON_RED, linewidth=0)
-        ax.plot(years, views, color=ECON_RED, linewidth=1.8, solid_capstyle='round')
-        ax.plot(peak_yr, peak, 'o', color=ECON_RED, markersize=4, zorder=5)
+        panel['data'] = [
+            ax.fill_between(years, views, alpha=0.12, color=ECON_RED, linewidth=0),
+            *ax.plot(years, views, color=ECON_RED, linewidth=1.8, solid_capstyle='round'),
+            *ax.plot(peak_yr, peak, 'o', color=ECON_RED, markersize=4, zorder=5),
+            # Baseline goes on after the data so it sits over any zero values
+            ax.axhline(y=0, color='#AAAAAA', linewidth=0.6),
+        ]
 
         # ── Panel title with rank ──
         ax.set_title(f'#{rank}  {name}', fontsize=10.5, fontweight='bold',
                      fontfamily=title_font, color=ECON_DARK, loc='left', pad=18)
-
-        # ── Red top rule per panel ──
-        ax_pos = ax.get_position()
-        fig.patches.append(plt.Rectangle(
-            (ax_pos.x0, ax_pos.y1 + 0.018), ax_pos.width, 0.0025,
-            transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-        ))
-
-        # ── Total annotation ──
-        ax.text(0.98, 0.95, f'{fmt(lang["total"])} total',
-                transform=ax.transAxes, fontsize=7.5, color=ECON_GREY,
-                ha='right', va='top', fontfamily=body_font)
+        panel['total'].set_text(f'{fmt(table.total[row])} total')
 
         # ── Y-axis ──
-        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-        ax.yaxis.set_major_locator(mticker.MaxNLocator(nbins=4, integer=False))
-        ax.tick_params(axis='y', labelsize=7.5, length=0, pad=2)
-        ax.tick_params(axis='x', labelsize=7, length=0, pad=2)
-
-        # ── X-axis ──
-        ax.set_xticks([2016, 2020, 2025])
-        ax.set_xticklabels(["'16", "'20", "'25"], fontsize=7.5)
-        ax.set_xlim(2015.3, 2025.7)
-
-        # ── Grid + baseline ──
-        ax.grid(axis='y', linewidth=0.4, color=ECON_LIGHT)
-        ax.set_axisbelow(True)
-        ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
-
-    # ── Source ─────────────────────────────────────────────
-    fig.text(0.04, 0.018,
-             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · Users-agents data',
-             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-    fig.text(0.97, 0.018, f'Page {page+1}/{total_pages}',
-             fontsize=9, color='#AAAAAA', fontfamily=body_font, va='bottom',
-             ha='right', style='italic')
-
-    outpath = f'../charts/econ_all_langs_page_{page+1:02d}.png'
-    plt.savefig(outpath, dpi=200, bbox_inches='tight',
+        econ_axes.apply_y_ticks(ax, y_lims[idx], y_ticks[idx], y_labels[idx])
+
+    # fig.savefig rather than plt.savefig: pyplot redraws the whole canvas
+    # again after saving, which is wasted work for a file-only backend
+    fig.savefig(outpath, dpi=200, bbox_inches='tight',
                 facecolor=ECON_BG, edgecolor='none')
-    plt.close()
     print(f'✓ Page {page+1}/{total_pages}: langs #{start+1}–{end}')
 
-print(f'\n=== ALL {total_pages} PAGES GENERATED ===')
+
+jobs = [(f'../charts/econ_all_langs_page_{page+1:02d}.png',
+         lambda outpath, page=page: render_page(page, outpath))
+        for page in range(total_pages)]
+shard = econ_shard.run('econ_all_langs', jobs)
+plt.close(fig)
+
+if shard is None:
+    print(f'\n=== ALL {total_pages} PAGES GENERATED ===')
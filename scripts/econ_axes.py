@@ -0,0 +1,80 @@
+"""
+Shared axis formatting for the Economist-style charts.
+
+Small-multiple panels all use the same y-axis recipe (zero-based data,
+5% margins, MaxNLocator(nbins=4)) and the same '16 / '20 / '25 x-axis.
+nice_ticks() works out the y limits, tick positions and fmt() labels for
+every series in one vectorized pass, and apply_y_ticks() pins them with
+fixed locators/formatters so matplotlib does no tick search or per-tick
+formatting at draw time.
+"""
+import matplotlib.ticker as mticker
+import numpy as np
+
+# Small-multiple x-axis: first, middle and last year only
+YEAR_TICKS  = [2016, 2020, 2025]
+YEAR_LABELS = ["'16", "'20", "'25"]
+YEAR_LIM    = (2015.3, 2025.7)
+
+# MaxNLocator's default step ladder (steps=None)
+_STEPS = np.array([1, 1.5, 2, 2.5, 3, 4, 5, 6, 8, 10])
+
+
+def fmt(val):
+    if val >= 1e9:   return f'{val/1e9:.1f}B'
+    if val >= 1e6:   return f'{val/1e6:.0f}M'
+    if val >= 1e3:   return f'{val/1e3:.0f}K'
+    return str(int(val))
+
+
+def fmt_formatter():
+    """FuncFormatter over fmt(), for axes that keep their own locator."""
+    return mticker.FuncFormatter(lambda v, p: fmt(v))
+
+
+def nice_ticks(peaks, nbins=4, margin=0.05):
+    """
+    Y limits, tick positions and labels for zero-based series with the given
+    peaks, matching what autoscaling plus MaxNLocator(nbins) would pick.
+    An all-zero series gets autoscaling's nonsingular limits (0 ± 0.05, plus
+    margins) and a single 0 tick, instead of fractional ticks fmt() would
+    all print as '0'.
+    Returns (lims, ticks, labels): an (n, 2) array and two length-n lists.
+    """
+    peaks = np.asarray(peaks, dtype=float)
+    flat = ~(peaks > 0)
+    # Locator.nonsingular() widens a zero-height range to ±0.05 before margins
+    half = np.where(flat, 0.05, peaks / 2)
+    vmin = np.where(flat, -half, 0.0) - 2 * half * margin
+    vmax = np.where(flat, half, peaks) + 2 * half * margin
+    raw = (vmax - vmin) / nbins
+    scale = 10.0 ** np.floor(np.log10(raw))
+    cand = scale[:, None] * _STEPS
+    step = cand[np.arange(len(peaks)), (cand >= raw[:, None]).argmax(axis=1)]
+
+    lo = np.floor(vmin / step)
+    hi = np.ceil(vmax / step)
+    ticks, labels = [], []
+    for k0, k1, s, f in zip(lo, hi, step, flat):
+        t = np.zeros(1) if f else np.arange(k0, k1 + 1) * s
+        ticks.append(t)
+        labels.append([fmt(v) for v in t.tolist()])
+    return np.column_stack([vmin, vmax]), ticks, labels
+
+
+def apply_y_ticks(ax, lim, ticks, labels):
+    """Pin precomputed limits, ticks and labels (one entry of nice_ticks())."""
+    ax.set_ylim(*lim)
+    ax.yaxis.set_major_locator(mticker.FixedLocator(ticks))
+    ax.yaxis.set_major_formatter(mticker.FixedFormatter(labels))
+
+
+def style_small_multiple(ax, grid_color):
+    """Static panel chrome shared by every small-multiple panel."""
+    ax.tick_params(axis='y', labelsize=7.5, length=0, pad=2)
+    ax.tick_params(axis='x', labelsize=7, length=0, pad=2)
+    ax.set_xticks(YEAR_TICKS)
+    ax.set_xticklabels(YEAR_LABELS, fontsize=7.5)
+    ax.set_xlim(*YEAR_LIM)
+    ax.grid(axis='y', linewidth=0.4, color=grid_color)
+    ax.set_axisbelow(True)
@@ -1,23 +1,22 @@
-import json
+import itertools
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
 import matplotlib.font_manager as fm
 import numpy as np
 from matplotlib.gridspec import GridSpec
 
+import econ_axes
+import econ_data
+import econ_shard
+
 # ── Load data ──────────────────────────────────────────────
-with open('../data/data.json') as f:
-    raw = json.load(f)
+table = econ_data.load_views('../data/data.json')
 
-years = raw['years']
-data = raw['data']
-langs = sorted(
-    [d for d in data if not d['is_summary']],
-    key=lambda x: x['total'], reverse=True
-)
-summary = [d for d in data if d['is_summary']][0]
+years = table.years
+lang_rows = np.flatnonzero(~table.is_summary)
+lang_order = lang_rows[np.argsort(-table.total[lang_rows], kind='stable')]
+summary = table.record(np.flatnonzero(table.is_summary)[0])
 
 lang_names = {
     'en': 'English', 'es': 'Spanish', 'de': 'German', 'ru': 'Russian',
@@ -42,11 +41,7 @@ lang_names = {
 def get_name(code):
     return lang_names.get(code, code.upper())
 
-def fmt(val):
-    if val >= 1e9:   return f'{val/1e9:.1f}B'
-    if val >= 1e6:   return f'{val/1e6:.0f}M'
-    if val >= 1e3:   return f'{val/1e3:.0f}K'
-    return str(int(val))
+fmt = econ_axes.fmt
 
 # ── Economist palette ──────────────────────────────────────
 ECON_RED     = '#E3120B'
@@ -57,6 +52,13 @@ ECON_BG      = '#F7F5F0'  # warm off-white
 ECON_FILL    = '#E3120B'
 ECON_BLUE    = '#006BA6'   # secondary accent
 
+# Economist uses a muted but distinguishable palette
+econ_colors = [
+    '#E3120B', '#006BA6', '#00843D', '#F5A623', '#6B3FA0',
+    '#1B7A7D', '#D45D00', '#8B0000', '#2E86AB', '#A23B72',
+    '#3C6E71', '#E07A5F', '#5F0F40', '#48639C', '#C97C5D'
+]
+
 # ── Register fonts ─────────────────────────────────────────
 # Economist uses proprietary fonts; we approximate with Georgia + Franklin Gothic
 # Fallback to available serif + sans
@@ -166,336 +168,331 @@ def place_end_labels(ax, label_list, x_pos, fontsize, fontfamily):
 #  PAGE 1: ALL LANGUAGES – SMALL MULTIPLES
 # ═══════════════════════════════════════════════════════════
 
-top_n = 25
-ncols = 5
-nrows = 5
-
-fig = plt.figure(figsize=(22, 30), facecolor=ECON_BG)
-
-# Outer margins
-fig.subplots_adjust(left=0.04, right=0.97, top=0.90, bottom=0.04, hspace=0.55, wspace=0.28)
-
-# ── Title block (Economist header style) ───────────────────
-# Red rule at very top
-fig.patches.append(plt.Rectangle(
-    (0.04, 0.965), 0.93, 0.006,
-    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-))
-
-fig.text(0.04, 0.955, 'Wikipedia medical articles',
-         fontsize=28, fontweight='bold', fontfamily=title_font,
-         color=ECON_DARK, va='top')
-fig.text(0.04, 0.935, 'User views by language, 2016–25*',
-         fontsize=16, color=ECON_GREY, fontfamily=body_font, va='top')
-fig.text(0.04, 0.920, 'Annual pageviews, top 25 languages by total views  |  *2025 figure is year-to-date',
-         fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
-
-# ── Small multiples ────────────────────────────────────────
-gs = GridSpec(nrows, ncols, figure=fig,
-             left=0.04, right=0.97, top=0.86, bottom=0.06,
-             hspace=0.85, wspace=0.30)
-
-for idx in range(top_n):
-    lang = langs[idx]
-    row = idx // ncols
-    col = idx % ncols
-    ax = fig.add_subplot(gs[row, col])
-
-    views = [lang[str(y)] for y in years]
-    name  = get_name(lang['lang'])
-    code  = lang['lang']
-    peak  = max(views)
-    peak_yr = years[views.index(peak)]
-
-    # ── Area fill + line ──
-    ax.fill_between(years, views, alpha=0.12, color=ECON_RED, linewidth=0)
-    ax.plot(years, views, color=ECON_RED, linewidth=1.8, solid_capstyle='round')
-
-    # Highlight peak with a dot
-    ax.plot(peak_yr, peak, 'o', color=ECON_RED, markersize=4, zorder=5)
-
-    # ── Panel title ──
-    ax.set_title(f'{name}', fontsize=11, fontweight='bold', fontfamily=title_font,
-                 color=ECON_DARK, loc='left', pad=18)
-
-    # ── Red top rule per panel (placed AFTER title so we can position above it) ──
-    ax_pos = ax.get_position()
+def page_small_multiples(outpath):
+    top_n = 25
+    ncols = 5
+    nrows = 5
+
+    fig = plt.figure(figsize=(22, 30), facecolor=ECON_BG)
+
+    # Outer margins
+    fig.subplots_adjust(left=0.04, right=0.97, top=0.90, bottom=0.04, hspace=0.55, wspace=0.28)
+
+    # ── Title block (Economist header style) ───────────────────
+    # Red rule at very top
     fig.patches.append(plt.Rectangle(
-        (ax_pos.x0, ax_pos.y1 + 0.018), ax_pos.width, 0.0025,
+        (0.04, 0.965), 0.93, 0.006,
         transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
     ))
 
-    # ── Total annotation (top right) ──
-    ax.text(0.98, 0.95, f'{fmt(lang["total"])} total',
-            transform=ax.transAxes, fontsize=7.5, color=ECON_GREY,
-            ha='right', va='top', fontfamily=body_font)
+    fig.text(0.04, 0.955, 'Wikipedia medical articles',
+             fontsize=28, fontweight='bold', fontfamily=title_font,
+             color=ECON_DARK, va='top')
+    fig.text(0.04, 0.935, 'User views by language, 2016–25*',
+             fontsize=16, color=ECON_GREY, fontfamily=body_font, va='top')
+    fig.text(0.04, 0.920, 'Annual pageviews, top 25 languages by total views  |  *2025 figure is year-to-date',
+             fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
+
+    # ── Small multiples ────────────────────────────────────────
+    y_lims, y_ticks, y_labels = econ_axes.nice_ticks(table.views[lang_order[:top_n]].max(axis=1))
+
+    gs = GridSpec(nrows, ncols, figure=fig,
+                 left=0.04, right=0.97, top=0.86, bottom=0.06,
+                 hspace=0.85, wspace=0.30)
+
+    for idx, lang in enumerate(table.records(lang_order[:top_n])):
+        row = idx // ncols
+        col = idx % ncols
+        ax = fig.add_subplot(gs[row, col])
+
+        views = [lang[str(y)] for y in years]
+        name  = get_name(lang['lang'])
+        code  = lang['lang']
+        peak  = max(views)
+        peak_yr = years[views.index(peak)]
+
+        # ── Area fill + line ──
+        ax.fill_between(years, views, alpha=0.12, color=ECON_RED, linewidth=0)
+        ax.plot(years, views, color=ECON_RED, linewidth=1.8, solid_capstyle='round')
+
+        # Highlight peak with a dot
+        ax.plot(peak_yr, peak, 'o', color=ECON_RED, markersize=4, zorder=5)
+
+        # ── Panel title ──
+        ax.set_title(f'{name}', fontsize=11, fontweight='bold', fontfamily=title_font,
+                     color=ECON_DARK, loc='left', pad=18)
+
+        # ── Red top rule per panel (placed AFTER title so we can position above it) ──
+        ax_pos = ax.get_position()
+        fig.patches.append(plt.Rectangle(
+            (ax_pos.x0, ax_pos.y1 + 0.018), ax_pos.width, 0.0025,
+            transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+        ))
+
+        # ── Total annotation (top right) ──
+        ax.text(0.98, 0.95, f'{fmt(lang["total"])} total',
+                transform=ax.transAxes, fontsize=7.5, color=ECON_GREY,
+                ha='right', va='top', fontfamily=body_font)
+
+        # ── Axes: precomputed y ticks, shared '16 / '20 / '25 x-axis, grid ──
+        econ_axes.apply_y_ticks(ax, y_lims[idx], y_ticks[idx], y_labels[idx])
+        econ_axes.style_small_multiple(ax, ECON_LIGHT)
+
+        # ── Bottom baseline ──
+        ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+
+    # ── Source line (bottom) ───────────────────────────────────
+    fig.text(0.04, 0.018,
+             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · Users-agents data',
+             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
+    fig.text(0.97, 0.018, 'Chart: Economist style',
+             fontsize=9, color='#AAAAAA', fontfamily=body_font, va='bottom', ha='right', style='italic')
+
+    fig.savefig(outpath, dpi=220, bbox_inches='tight',
+                facecolor=ECON_BG, edgecolor='none')
+    plt.close(fig)
+    print("✓ Page 1: Top 25 small multiples")
 
-    # ── Y-axis formatting ──
-    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-    ax.yaxis.set_major_locator(mticker.MaxNLocator(nbins=4, integer=False))
-    ax.tick_params(axis='y', labelsize=7.5, length=0, pad=2)
-    ax.tick_params(axis='x', labelsize=7, length=0, pad=2)
 
-    # ── X-axis: show only first, middle, last ──
-    ax.set_xticks([2016, 2020, 2025])
-    ax.set_xticklabels(["'16", "'20", "'25"], fontsize=7.5)
-    ax.set_xlim(2015.3, 2025.7)
-
-    # ── Grid ──
-    ax.grid(axis='y', linewidth=0.4, color=ECON_LIGHT)
-    ax.set_axisbelow(True)
+# ═══════════════════════════════════════════════════════════
+#  PAGE 2: GLOBAL COMBINED TREND (Economist hero chart)
+# ═══════════════════════════════════════════════════════════
 
-    # ── Bottom baseline ──
-    ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+def page_global_trend(outpath):
+    fig, ax = plt.subplots(figsize=(14, 8), facecolor=ECON_BG)
 
-# ── Source line (bottom) ───────────────────────────────────
-fig.text(0.04, 0.018,
-         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · Users-agents data',
-         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-fig.text(0.97, 0.018, 'Chart: Economist style',
-         fontsize=9, color='#AAAAAA', fontfamily=body_font, va='bottom', ha='right', style='italic')
+    global_views = [summary[str(y)] for y in years]
 
-plt.savefig('../charts/econ_small_multiples_top25.png', dpi=220, bbox_inches='tight',
-            facecolor=ECON_BG, edgecolor='none')
-plt.close()
-print("✓ Page 1: Top 25 small multiples")
+    # Red rule
+    fig.patches.append(plt.Rectangle(
+        (0.06, 0.94), 0.88, 0.008,
+        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+    ))
 
+    fig.text(0.06, 0.925, 'The health of health content',
+             fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
+    fig.text(0.06, 0.865, 'Wikipedia medical articles, total user views across all 337 languages, bn',
+             fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+
+    # Area + line
+    ax.fill_between(years, global_views, alpha=0.12, color=ECON_RED, linewidth=0)
+    ax.plot(years, global_views, color=ECON_RED, linewidth=3, solid_capstyle='round')
+    ax.plot(years, global_views, 'o', color=ECON_RED, markersize=6, zorder=5)
+
+    # Annotate each point
+    for i, v in enumerate(global_views):
+        offset = 16 if i != global_views.index(min(global_views)) else -20
+        ax.annotate(f'{v/1e9:.2f}B', (years[i], v),
+                    textcoords="offset points", xytext=(0, offset),
+                    ha='center', fontsize=10, fontweight='bold', color=ECON_DARK,
+                    fontfamily=body_font)
+
+    # COVID annotation
+    ax.annotate('COVID-19\npandemic →', xy=(2020, global_views[4]),
+                xytext=(2017.5, global_views[4] * 1.05),
+                fontsize=10, color=ECON_GREY, fontfamily=body_font,
+                ha='center', va='bottom',
+                arrowprops=dict(arrowstyle='->', color=ECON_GREY, lw=1.2))
+
+    ax.yaxis.set_major_formatter(econ_axes.fmt_formatter())
+    ax.set_xticks(years)
+    ax.set_xticklabels([str(y) for y in years], fontsize=11)
+    ax.tick_params(axis='y', labelsize=11, length=0)
+    ax.tick_params(axis='x', length=0)
+    ax.grid(axis='y', linewidth=0.5)
+    ax.set_axisbelow(True)
+    ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+    ax.set_xlim(2015.3, 2025.7)
 
-# ═══════════════════════════════════════════════════════════
-#  PAGE 2: GLOBAL COMBINED TREND (Economist hero chart)
-# ═══════════════════════════════════════════════════════════
+    fig.text(0.06, 0.02,
+             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
+             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
 
-fig, ax = plt.subplots(figsize=(14, 8), facecolor=ECON_BG)
-
-global_views = [summary[str(y)] for y in years]
-
-# Red rule
-fig.patches.append(plt.Rectangle(
-    (0.06, 0.94), 0.88, 0.008,
-    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-))
-
-fig.text(0.06, 0.925, 'The health of health content',
-         fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
-fig.text(0.06, 0.865, 'Wikipedia medical articles, total user views across all 337 languages, bn',
-         fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
-
-# Area + line
-ax.fill_between(years, global_views, alpha=0.12, color=ECON_RED, linewidth=0)
-ax.plot(years, global_views, color=ECON_RED, linewidth=3, solid_capstyle='round')
-ax.plot(years, global_views, 'o', color=ECON_RED, markersize=6, zorder=5)
-
-# Annotate each point
-for i, v in enumerate(global_views):
-    offset = 16 if i != global_views.index(min(global_views)) else -20
-    ax.annotate(f'{v/1e9:.2f}B', (years[i], v),
-                textcoords="offset points", xytext=(0, offset),
-                ha='center', fontsize=10, fontweight='bold', color=ECON_DARK,
-                fontfamily=body_font)
-
-# COVID annotation
-ax.annotate('COVID-19\npandemic →', xy=(2020, global_views[4]),
-            xytext=(2017.5, global_views[4] * 1.05),
-            fontsize=10, color=ECON_GREY, fontfamily=body_font,
-            ha='center', va='bottom',
-            arrowprops=dict(arrowstyle='->', color=ECON_GREY, lw=1.2))
-
-ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-ax.set_xticks(years)
-ax.set_xticklabels([str(y) for y in years], fontsize=11)
-ax.tick_params(axis='y', labelsize=11, length=0)
-ax.tick_params(axis='x', length=0)
-ax.grid(axis='y', linewidth=0.5)
-ax.set_axisbelow(True)
-ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
-ax.set_xlim(2015.3, 2025.7)
-
-fig.text(0.06, 0.02,
-         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
-         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-
-plt.subplots_adjust(top=0.80, bottom=0.08, left=0.08, right=0.96)
-plt.savefig('../charts/econ_global_trend.png', dpi=220, bbox_inches='tight',
-            facecolor=ECON_BG, edgecolor='none')
-plt.close()
-print("✓ Page 2: Global hero chart")
+    plt.subplots_adjust(top=0.80, bottom=0.08, left=0.08, right=0.96)
+    fig.savefig(outpath, dpi=220, bbox_inches='tight',
+                facecolor=ECON_BG, edgecolor='none')
+    plt.close(fig)
+    print("✓ Page 2: Global hero chart")
 
 
 # ═══════════════════════════════════════════════════════════
 #  PAGE 3: TOP 15 COMBINED LINE CHART
 # ═══════════════════════════════════════════════════════════
 
-fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
+def page_top15_combined(outpath):
+    fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
+
+    fig.patches.append(plt.Rectangle(
+        (0.05, 0.945), 0.90, 0.008,
+        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+    ))
+    fig.text(0.05, 0.932, 'A polyglot readership',
+             fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
+    fig.text(0.05, 0.905, 'User views of Wikipedia medical articles by language, top 15',
+             fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+
+    top15 = table.records(lang_order[:15])
+    labels_p3 = []
+    for i, lang in enumerate(top15):
+        views = [lang[str(y)] for y in years]
+        name = get_name(lang['lang'])
+        lw = 2.5 if i < 5 else 1.5
+        alpha = 1.0 if i < 5 else 0.7
+
+        ax.plot(years, views, color=econ_colors[i], linewidth=lw,
+                alpha=alpha, solid_capstyle='round')
+
+        labels_p3.append({
+            'y': views[-1], 'text': name, 'color': econ_colors[i],
+            'fontweight': 'bold' if i < 5 else 'normal'
+        })
+
+    ax.yaxis.set_major_formatter(econ_axes.fmt_formatter())
+    ax.set_xticks(years)
+    ax.set_xticklabels([str(y) for y in years], fontsize=10)
+    ax.tick_params(axis='y', labelsize=10, length=0)
+    ax.tick_params(axis='x', length=0)
+    ax.grid(axis='y', linewidth=0.5)
+    ax.set_axisbelow(True)
+    ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+    ax.set_xlim(2015.3, 2027.3)  # extra space for labels
 
-fig.patches.append(plt.Rectangle(
-    (0.05, 0.945), 0.90, 0.008,
-    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-))
-fig.text(0.05, 0.932, 'A polyglot readership',
-         fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
-fig.text(0.05, 0.905, 'User views of Wikipedia medical articles by language, top 15',
-         fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+    # Place de-overlapped labels
+    place_end_labels(ax, labels_p3, 2025.3, 8.5, body_font)
 
-# Economist uses a muted but distinguishable palette
-econ_colors = [
-    '#E3120B', '#006BA6', '#00843D', '#F5A623', '#6B3FA0',
-    '#1B7A7D', '#D45D00', '#8B0000', '#2E86AB', '#A23B72',
-    '#3C6E71', '#E07A5F', '#5F0F40', '#48639C', '#C97C5D'
-]
+    fig.text(0.05, 0.02,
+             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
+             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
 
-top15 = langs[:15]
-labels_p3 = []
-for i, lang in enumerate(top15):
-    views = [lang[str(y)] for y in years]
-    name = get_name(lang['lang'])
-    lw = 2.5 if i < 5 else 1.5
-    alpha = 1.0 if i < 5 else 0.7
-
-    ax.plot(years, views, color=econ_colors[i], linewidth=lw,
-            alpha=alpha, solid_capstyle='round')
-
-    labels_p3.append({
-        'y': views[-1], 'text': name, 'color': econ_colors[i],
-        'fontweight': 'bold' if i < 5 else 'normal'
-    })
-
-ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-ax.set_xticks(years)
-ax.set_xticklabels([str(y) for y in years], fontsize=10)
-ax.tick_params(axis='y', labelsize=10, length=0)
-ax.tick_params(axis='x', length=0)
-ax.grid(axis='y', linewidth=0.5)
-ax.set_axisbelow(True)
-ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
-ax.set_xlim(2015.3, 2027.3)  # extra space for labels
-
-# Place de-overlapped labels
-place_end_labels(ax, labels_p3, 2025.3, 8.5, body_font)
-
-fig.text(0.05, 0.02,
-         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
-         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-
-plt.subplots_adjust(top=0.85, bottom=0.07, left=0.07, right=0.87)
-plt.savefig('../charts/econ_top15_combined.png', dpi=220, bbox_inches='tight',
-            facecolor=ECON_BG, edgecolor='none')
-plt.close()
-print("✓ Page 3: Top 15 combined")
+    plt.subplots_adjust(top=0.85, bottom=0.07, left=0.07, right=0.87)
+    fig.savefig(outpath, dpi=220, bbox_inches='tight',
+                facecolor=ECON_BG, edgecolor='none')
+    plt.close(fig)
+    print("✓ Page 3: Top 15 combined")
 
 
 # ═══════════════════════════════════════════════════════════
 #  PAGE 4: TOP 15 EXCLUDING ENGLISH (rescaled)
 # ═══════════════════════════════════════════════════════════
 
-fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
-
-fig.patches.append(plt.Rectangle(
-    (0.05, 0.945), 0.90, 0.008,
-    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-))
-fig.text(0.05, 0.932, 'Beyond English',
-         fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
-fig.text(0.05, 0.905, 'User views of Wikipedia medical articles, top 14 non-English languages',
-         fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
-
-top14_ne = [l for l in langs if l['lang'] != 'en'][:14]
-labels_p4 = []
-for i, lang in enumerate(top14_ne):
-    views = [lang[str(y)] for y in years]
-    name = get_name(lang['lang'])
-    lw = 2.5 if i < 5 else 1.5
-    alpha = 1.0 if i < 5 else 0.7
-
-    ax.plot(years, views, color=econ_colors[i], linewidth=lw,
-            alpha=alpha, solid_capstyle='round')
-    labels_p4.append({
-        'y': views[-1], 'text': name, 'color': econ_colors[i],
-        'fontweight': 'bold' if i < 5 else 'normal'
-    })
-
-ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-ax.set_xticks(years)
-ax.set_xticklabels([str(y) for y in years], fontsize=10)
-ax.tick_params(axis='y', labelsize=10, length=0)
-ax.tick_params(axis='x', length=0)
-ax.grid(axis='y', linewidth=0.5)
-ax.set_axisbelow(True)
-ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
-ax.set_xlim(2015.3, 2027.3)
-
-# Place de-overlapped labels
-place_end_labels(ax, labels_p4, 2025.3, 8.5, body_font)
-
-fig.text(0.05, 0.02,
-         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
-         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-
-plt.subplots_adjust(top=0.85, bottom=0.07, left=0.07, right=0.87)
-plt.savefig('../charts/econ_top14_no_english.png', dpi=220, bbox_inches='tight',
-            facecolor=ECON_BG, edgecolor='none')
-plt.close()
-print("✓ Page 4: Top 14 excl. English")
+def page_top14_no_english(outpath):
+    fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
+
+    fig.patches.append(plt.Rectangle(
+        (0.05, 0.945), 0.90, 0.008,
+        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+    ))
+    fig.text(0.05, 0.932, 'Beyond English',
+             fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
+    fig.text(0.05, 0.905, 'User views of Wikipedia medical articles, top 14 non-English languages',
+             fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+
+    top14_ne = table.records(itertools.islice(
+        (r for r in lang_order if table.lang[r] != 'en'), 14))
+    labels_p4 = []
+    for i, lang in enumerate(top14_ne):
+        views = [lang[str(y)] for y in years]
+        name = get_name(lang['lang'])
+        lw = 2.5 if i < 5 else 1.5
+        alpha = 1.0 if i < 5 else 0.7
+
+        ax.plot(years, views, color=econ_colors[i], linewidth=lw,
+                alpha=alpha, solid_capstyle='round')
+        labels_p4.append({
+            'y': views[-1], 'text': name, 'color': econ_colors[i],
+            'fontweight': 'bold' if i < 5 else 'normal'
+        })
+
+    ax.yaxis.set_major_formatter(econ_axes.fmt_formatter())
+    ax.set_xticks(years)
+    ax.set_xticklabels([str(y) for y in years], fontsize=10)
+    ax.tick_params(axis='y', labelsize=10, length=0)
+    ax.tick_params(axis='x', length=0)
+    ax.grid(axis='y', linewidth=0.5)
+    ax.set_axisbelow(True)
+    ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+    ax.set_xlim(2015.3, 2027.3)
+
+    # Place de-overlapped labels
+    place_end_labels(ax, labels_p4, 2025.3, 8.5, body_font)
+
+    fig.text(0.05, 0.02,
+             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
+             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
+
+    plt.subplots_adjust(top=0.85, bottom=0.07, left=0.07, right=0.87)
+    fig.savefig(outpath, dpi=220, bbox_inches='tight',
+                facecolor=ECON_BG, edgecolor='none')
+    plt.close(fig)
+    print("✓ Page 4: Top 14 excl. English")
 
 
 # ═══════════════════════════════════════════════════════════
 #  PAGE 5: GROWTH CHAMPIONS
 # ═══════════════════════════════════════════════════════════
 
-fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
-
-fig.patches.append(plt.Rectangle(
-    (0.05, 0.945), 0.90, 0.008,
-    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
-))
-fig.text(0.05, 0.932, 'Rising stars',
-         fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
-fig.text(0.05, 0.905, 'Fastest-growing languages for medical Wikipedia views, 2016–24 (% change)',
-         fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
-fig.text(0.05, 0.883, 'Languages with >100,000 views in 2016, ranked by percentage growth',
-         fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
-
-growth_langs = []
-for lang in langs:
-    v16 = lang[str(2016)]
-    v24 = lang[str(2024)]
-    if v16 > 100000:
-        growth = (v24 - v16) / v16 * 100
-        growth_langs.append((lang, growth))
-growth_langs.sort(key=lambda x: x[1], reverse=True)
-top_growers = growth_langs[:12]
-
-labels_p5 = []
-for i, (lang, growth) in enumerate(top_growers):
-    views = [lang[str(y)] for y in years]
-    name = get_name(lang['lang'])
-    ax.plot(years, views, color=econ_colors[i], linewidth=2, solid_capstyle='round')
-    label = f'{name} (+{growth:.0f}%)' if growth > 0 else f'{name} ({growth:.0f}%)'
-    labels_p5.append({
-        'y': views[-1], 'text': label, 'color': econ_colors[i % len(econ_colors)],
-        'fontweight': 'bold'
-    })
-
-ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, p: fmt(v)))
-ax.set_xticks(years)
-ax.set_xticklabels([str(y) for y in years], fontsize=10)
-ax.tick_params(axis='y', labelsize=10, length=0)
-ax.tick_params(axis='x', length=0)
-ax.grid(axis='y', linewidth=0.5)
-ax.set_axisbelow(True)
-ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
-ax.set_xlim(2015.3, 2028.5)
-
-# Place de-overlapped labels
-place_end_labels(ax, labels_p5, 2025.3, 8, body_font)
-
-fig.text(0.05, 0.02,
-         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
-         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
-
-plt.subplots_adjust(top=0.83, bottom=0.07, left=0.07, right=0.82)
-plt.savefig('../charts/econ_growth_champions.png', dpi=220, bbox_inches='tight',
-            facecolor=ECON_BG, edgecolor='none')
-plt.close()
-print("✓ Page 5: Growth champions")
-
-print("\n=== ALL ECONOMIST-STYLE CHARTS GENERATED ===")
+def page_growth_champions(outpath):
+    fig, ax = plt.subplots(figsize=(16, 10), facecolor=ECON_BG)
+
+    fig.patches.append(plt.Rectangle(
+        (0.05, 0.945), 0.90, 0.008,
+        transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+    ))
+    fig.text(0.05, 0.932, 'Rising stars',
+             fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
+    fig.text(0.05, 0.905, 'Fastest-growing languages for medical Wikipedia views, 2016–24 (% change)',
+             fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+    fig.text(0.05, 0.883, 'Languages with >100,000 views in 2016, ranked by percentage growth',
+             fontsize=11, color='#888888', fontfamily=body_font, va='top', style='italic')
+
+    y16, y24 = years.index(2016), years.index(2024)
+    candidates = lang_order[table.views[lang_order, y16] > 100000]
+    v16 = table.views[candidates, y16]
+    growth = (table.views[candidates, y24] - v16) / v16 * 100
+    ranked = np.argsort(-growth, kind='stable')[:12]
+    top_growers = list(zip(table.records(candidates[ranked]), growth[ranked].tolist()))
+
+    labels_p5 = []
+    for i, (lang, growth) in enumerate(top_growers):
+        views = [lang[str(y)] for y in years]
+        name = get_name(lang['lang'])
+        ax.plot(years, views, color=econ_colors[i], linewidth=2, solid_capstyle='round')
+        label = f'{name} (+{growth:.0f}%)' if growth > 0 else f'{name} ({growth:.0f}%)'
+        labels_p5.append({
+            'y': views[-1], 'text': label, 'color': econ_colors[i % len(econ_colors)],
+            'fontweight': 'bold'
+        })
+
+    ax.yaxis.set_major_formatter(econ_axes.fmt_formatter())
+    ax.set_xticks(years)
+    ax.set_xticklabels([str(y) for y in years], fontsize=10)
+    ax.tick_params(axis='y', labelsize=10, length=0)
+    ax.tick_params(axis='x', length=0)
+    ax.grid(axis='y', linewidth=0.5)
+    ax.set_axisbelow(True)
+    ax.axhline(y=0, color='#AAAAAA', linewidth=0.6)
+    ax.set_xlim(2015.3, 2028.5)
+
+    # Place de-overlapped labels
+    place_end_labels(ax, labels_p5, 2025.3, 8, body_font)
+
+    fig.text(0.05, 0.02,
+             'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
+             fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
+
+    plt.subplots_adjust(top=0.83, bottom=0.07, left=0.07, right=0.82)
+    fig.savefig(outpath, dpi=220, bbox_inches='tight',
+                facecolor=ECON_BG, edgecolor='none')
+    plt.close(fig)
+    print("✓ Page 5: Growth champions")
+
+
+jobs = [
+    ('../charts/econ_small_multiples_top25.png', page_small_multiples),
+    ('../charts/econ_global_trend.png', page_global_trend),
+    ('../charts/econ_top15_combined.png', page_top15_combined),
+    ('../charts/econ_top14_no_english.png', page_top14_no_english),
+    ('../charts/econ_growth_champions.png', page_growth_champions),
+]
+if econ_shard.run('econ_charts', jobs) is None:
+    print("\n=== ALL ECONOMIST-STYLE CHARTS GENERATED ===")
@@ -0,0 +1,218 @@
+"""
+Streaming reader for data.json-style exports.
+
+The file is {"years": [...], "data": [{...}, ...]} where each record has
+'lang', 'titles', 'is_summary', one key per year and 'total'.  Instead of
+json.load-ing the whole document, iter_records() walks the "data" array one
+record at a time from a fixed-size text buffer, and load_views() packs the
+records it keeps straight into numpy arrays, so multi-GB article-level
+exports can be read with memory close to the size of the numbers kept.
+"""
+import codecs
+import json
+
+import numpy as np
+
+_decoder = json.JSONDecoder()
+_WS = ' \t\n\r'
+# A decode error this close to the end of the buffer may just be a token
+# (number, literal, escape) cut off by the chunk boundary
+_TOKEN_SLACK = 64
+
+
+class _Scanner:
+    """Incremental JSON tokenizer over a UTF-8 file, one value at a time."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.text = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.consumed = 0  # bytes of the file before buf[0]
+        self.eof = False
+
+    def fill(self, size=None):
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        self.eof = not chunk
+        # Drop what has already been consumed before appending more
+        self.consumed += len(self.buf[:self.pos].encode('utf-8'))
+        self.buf = self.buf[self.pos:] + self.text.decode(chunk, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def offset(self, pos=None):
+        """File byte offset of buf[pos] (default: the current position)."""
+        pos = self.pos if pos is None else pos
+        return self.consumed + len(self.buf[:pos].encode('utf-8'))
+
+    def peek(self):
+        """Next non-whitespace character (not consumed), or '' at end of file."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f'{self.f.name}: expected one of {chars!r}, '
+                             f'got {ch or "end of file"!r} at byte {self.offset()}')
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """
+        Decode the next complete JSON value, reading more text only while the
+        decode error is at the end of the buffer, i.e. the value is merely
+        incomplete.  Anything else is malformed and raised straight away.
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                truncated = (e.pos >= len(self.buf) - _TOKEN_SLACK
+                             or e.msg.startswith('Unterminated string'))
+                # Double the read each time so a large value is copied O(log n) times
+                if truncated and self.fill(size):
+                    size *= 2
+                    continue
+                raise ValueError(f'{self.f.name}: {e.msg} at byte {self.offset(e.pos)}') from None
+            # A bare number ending at the buffer edge might continue in the next chunk
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_records(path, meta=None, chunk_size=1 << 20):
+    """
+    Yield the records of the top-level "data" array one at a time.  Any other
+    top-level keys (e.g. "years") are decoded whole and stored in meta, if
+    given, as they are passed.
+    """
+    with open(path, 'rb') as f:
+        s = _Scanner(f, chunk_size)
+        s.expect('{')
+        if s.peek() == '}':
+            return
+        while True:
+            key = s.value()
+            s.expect(':')
+            if key == 'data':
+                s.expect('[')
+                if s.peek() == ']':
+                    s.pos += 1
+                else:
+                    while True:
+                        yield s.value()
+                        if s.expect(',]') == ']':
+                            break
+            else:
+                val = s.value()
+                if meta is not None:
+                    meta[key] = val
+            if s.expect(',}') == '}':
+                break
+
+
+class ViewTable:
+    """
+    Column-oriented view of the kept records: views is an (n, len(years))
+    matrix, with per-record lang, titles, is_summary and total.  views and
+    total are int64, or float64 if the first kept record has float counts.
+    """
+
+    def __init__(self, years, lang, titles, is_summary, views, total):
+        self.years = years
+        self.lang = lang
+        self.titles = titles
+        self.is_summary = is_summary
+        self.views = views
+        self.total = total
+
+    def __len__(self):
+        return len(self.lang)
+
+    def record(self, i):
+        """Row i as a dict in the original data.json record shape."""
+        rec = {'lang': self.lang[i], 'titles': int(self.titles[i]),
+               'is_summary': bool(self.is_summary[i])}
+        rec.update(zip(map(str, self.years), self.views[i].tolist()))
+        rec['total'] = self.total[i].item()
+        return rec
+
+    def records(self, order=None):
+        return [self.record(i) for i in (range(len(self)) if order is None else order)]
+
+
+def load_views(path, langs=None, is_summary=None, chunk_size=1 << 20):
+    """
+    Stream path into a ViewTable, keeping only records whose 'lang' is in
+    langs (if given) and whose 'is_summary' equals is_summary (if not None).
+    Year columns come from the first kept record, since "data" may precede
+    "years" in the file; the two are checked against each other at the end.
+    The first kept record also fixes the count dtype: float64 if any of its
+    counts is a float, else int64.  A later non-integer count in an int64
+    table raises ValueError rather than being truncated.
+    """
+    keep_langs = None if langs is None else set(langs)
+    meta = {}
+    years = None
+    n, cap = 0, 1024
+    lang, codes = [], {}
+    titles = is_sum = views = total = None
+
+    for rec in iter_records(path, meta, chunk_size):
+        if is_summary is not None and bool(rec.get('is_summary')) != is_summary:
+            continue
+        if keep_langs is not None and rec.get('lang') not in keep_langs:
+            continue
+        if years is None:
+            years = sorted(int(k) for k in rec if k.isdigit())
+            keys = [str(y) for y in years]
+            is_float = any(isinstance(rec[k], float) for k in keys + ['total'])
+            dtype = np.float64 if is_float else np.int64
+            titles = np.zeros(cap, dtype=np.int64)
+            is_sum = np.zeros(cap, dtype=bool)
+            views  = np.zeros((cap, len(years)), dtype=dtype)
+            total  = np.zeros(cap, dtype=dtype)
+        if n == cap:
+            # Grow in place (realloc) rather than building Python lists
+            cap += cap // 2
+            for arr in (titles, is_sum, total):
+                arr.resize(cap, refcheck=False)
+            views.resize((cap, len(years)), refcheck=False)
+        # Share one str per distinct code; article-level files repeat them
+        lang.append(codes.setdefault(rec['lang'], rec['lang']))
+        titles[n] = rec.get('titles', 0)
+        is_sum[n] = rec.get('is_summary', False)
+        row = [rec[k] for k in keys]
+        row.append(rec['total'])
+        if not is_float:
+            for v in row:
+                if isinstance(v, float) and not v.is_integer():
+                    raise ValueError(f'non-integer count {v!r} for lang {rec["lang"]!r} '
+                                     f'in an integer table (first record had integer counts)')
+        views[n] = row[:-1]
+        total[n] = row[-1]
+        n += 1
+
+    if years is None:
+        years = list(meta.get('years', []))
+        return ViewTable(years, [], np.zeros(0, np.int64), np.zeros(0, bool),
+                         np.zeros((0, len(years)), np.int64), np.zeros(0, np.int64))
+    if 'years' in meta and list(meta['years']) != years:
+        raise ValueError(f'"years" {meta["years"]} does not match record year keys {years}')
+
+    for arr in (titles, is_sum, total):
+        arr.resize(n, refcheck=False)
+    views.resize((n, len(years)), refcheck=False)
+    return ViewTable(years, lang, titles, is_sum, views, total)
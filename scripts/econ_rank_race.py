@@ -0,0 +1,297 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
+import matplotlib.font_manager as fm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+
+import econ_axes
+import econ_data
+
+# ── Load data ──────────────────────────────────────────────
+table = econ_data.load_views('../data/data.json', is_summary=False)
+
+years = table.years
+by_total = np.argsort(-table.total, kind='stable')
+codes = [table.lang[i] for i in by_total]
+
+lang_names = {
+    'en': 'English', 'es': 'Spanish', 'de': 'German', 'ru': 'Russian',
+    'fr': 'French', 'ja': 'Japanese', 'it': 'Italian', 'pt': 'Portuguese',
+    'zh': 'Chinese', 'pl': 'Polish', 'fa': 'Persian', 'ar': 'Arabic',
+    'nl': 'Dutch', 'sv': 'Swedish', 'ko': 'Korean', 'fi': 'Finnish',
+    'he': 'Hebrew', 'cs': 'Czech', 'tr': 'Turkish', 'uk': 'Ukrainian',
+    'hi': 'Hindi', 'id': 'Indonesian', 'th': 'Thai', 'ro': 'Romanian',
+    'hu': 'Hungarian', 'vi': 'Vietnamese', 'bg': 'Bulgarian', 'da': 'Danish',
+    'el': 'Greek', 'sr': 'Serbian', 'bn': 'Bengali', 'no': 'Norwegian',
+    'hr': 'Croatian', 'sk': 'Slovak', 'kk': 'Kazakh', 'simple': 'Simple Eng.',
+    'sl': 'Slovenian', 'lt': 'Lithuanian', 'uz': 'Uzbek', 'ta': 'Tamil',
+    'ms': 'Malay', 'ka': 'Georgian', 'az': 'Azerbaijani', 'sq': 'Albanian',
+    'ca': 'Catalan', 'tl': 'Tagalog', 'ml': 'Malayalam', 'te': 'Telugu',
+    'mr': 'Marathi', 'hy': 'Armenian', 'af': 'Afrikaans', 'lv': 'Latvian',
+    'sw': 'Swahili', 'ky': 'Kyrgyz', 'et': 'Estonian', 'bs': 'Bosnian',
+    'mk': 'Macedonian', 'mn': 'Mongolian', 'gu': 'Gujarati', 'my': 'Burmese',
+    'si': 'Sinhala', 'tg': 'Tajik', 'ne': 'Nepali', 'ur': 'Urdu',
+    'km': 'Khmer', 'tk': 'Turkmen', 'kn': 'Kannada', 'am': 'Amharic',
+}
+
+def get_name(code):
+    return lang_names.get(code, code.upper())
+
+fmt = econ_axes.fmt
+
+# ── Economist palette ──────────────────────────────────────
+ECON_RED     = '#E3120B'
+ECON_DARK    = '#1A1A1A'
+ECON_GREY    = '#595959'
+ECON_LIGHT   = '#D9D9D9'
+ECON_BG      = '#F7F5F0'  # warm off-white
+
+econ_colors = [
+    '#E3120B', '#006BA6', '#00843D', '#F5A623', '#6B3FA0',
+    '#1B7A7D', '#D45D00', '#8B0000', '#2E86AB', '#A23B72',
+    '#3C6E71', '#E07A5F', '#5F0F40', '#48639C', '#C97C5D'
+]
+
+# Colour is what identifies a bar as the rows reorder, so every language that
+# can appear gets its own.  '#C97C5D' is dropped: at bar size it reads as the
+# same salmon as '#E07A5F'.
+race_colors = [c for c in econ_colors if c != '#C97C5D'] + [
+    '#7F7F7F', '#BCBD22', '#17BECF', '#8C564B', '#E377C2',
+    '#393B79', '#637939', '#C5B0D5', '#FFD92F', '#66C2A5', '#99D98C'
+]
+
+try:
+    available = set(f.name for f in fm.fontManager.ttflist)
+    title_font = 'Georgia' if 'Georgia' in available else 'DejaVu Serif'
+    body_font  = 'Franklin Gothic Medium' if 'Franklin Gothic Medium' in available else 'DejaVu Sans'
+except:
+    title_font = 'DejaVu Serif'
+    body_font  = 'DejaVu Sans'
+
+plt.rcParams.update({
+    'figure.facecolor': ECON_BG,
+    'axes.facecolor':   ECON_BG,
+    'axes.edgecolor':   'none',
+    'text.color':       ECON_DARK,
+    'font.family':      'sans-serif',
+    'font.sans-serif':  [body_font],
+    'axes.spines.top':    False,
+    'axes.spines.right':  False,
+    'axes.spines.left':   False,
+    'axes.spines.bottom': False,
+})
+
+# ── Animation settings ─────────────────────────────────────
+# MP4 needs ffmpeg on PATH; otherwise (or for a .gif path) fall back to a
+# smaller, slower GIF written with Pillow.
+top_n    = 15
+duration = 30       # seconds
+hold     = 0.5      # seconds spent paused on each actual year
+outpath  = sys.argv[1] if len(sys.argv) > 1 else (
+    '../charts/econ_rank_race.mp4' if shutil.which('ffmpeg') else '../charts/econ_rank_race.gif')
+as_gif   = outpath.endswith('.gif')
+fps      = 12 if as_gif else 30
+dpi      = 60 if as_gif else 120
+
+
+# ═══════════════════════════════════════════════════════════
+#  RANKS + INTERPOLATED FRAMES
+# ═══════════════════════════════════════════════════════════
+
+# Language × year matrix; one argsort ranks every year at once (0 = most views)
+views = table.views[by_total].astype(float)
+n_langs, n_years = views.shape
+order = np.argsort(-views, axis=0, kind='stable')
+ranks = np.empty_like(order)
+ranks[order, np.arange(n_years)] = np.arange(n_langs)[:, None]
+
+# Only languages that ever reach the visible table get artists; rank top_n is
+# included so bars can slide in from just below the last row.
+shown = np.flatnonzero((ranks <= top_n).any(axis=1))
+if len(shown) > len(race_colors):
+    race_colors += [mcolors.to_hex(c) for c in
+                    plt.cm.tab20(np.linspace(0, 1, len(shown) - len(race_colors)))]
+views, ranks = views[shown], ranks[shown]
+
+# Frame timeline in "year index" units: hold on each year, then glide to the
+# next; the run is extended by one more hold so the final year settles too
+n_frames = int(duration * fps)
+hold_frac = min(hold * (n_years - 1) / duration, 0.9)
+t = np.minimum(np.linspace(0, n_years - 1 + hold_frac, n_frames), n_years - 1)
+i0 = np.minimum(np.floor(t).astype(int), n_years - 2)
+u = np.clip((t - i0 - hold_frac) / (1 - hold_frac), 0, 1)
+ease = u * u * (3 - 2 * u)   # smoothstep for the reordering
+
+frame_views = views[:, i0] * (1 - u) + views[:, i0 + 1] * u
+frame_ranks = ranks[:, i0] * (1 - ease) + ranks[:, i0 + 1] * ease
+frame_lead  = frame_views.max(axis=0)
+frame_year  = np.where(u < 0.5, np.asarray(years)[i0], np.asarray(years)[i0 + 1])
+
+
+# ═══════════════════════════════════════════════════════════
+#  STATIC FIGURE (drawn once, cached as the blit background)
+# ═══════════════════════════════════════════════════════════
+
+fig, ax = plt.subplots(figsize=(16, 9), dpi=dpi, facecolor=ECON_BG)
+plt.subplots_adjust(top=0.82, bottom=0.08, left=0.16, right=0.95)
+
+fig.patches.append(plt.Rectangle(
+    (0.05, 0.945), 0.90, 0.008,
+    transform=fig.transFigure, facecolor=ECON_RED, edgecolor='none', zorder=10
+))
+fig.text(0.05, 0.932, 'Changing places',
+         fontsize=24, fontweight='bold', fontfamily=title_font, color=ECON_DARK, va='top')
+fig.text(0.05, 0.885, f'User views of Wikipedia medical articles by language, top {top_n} by year',
+         fontsize=13, color=ECON_GREY, fontfamily=body_font, va='top')
+fig.text(0.05, 0.02,
+         'Source: WikiProject Medicine · mdwiki.toolforge.org/views · *2025 is year-to-date',
+         fontsize=9, color='#888888', fontfamily=body_font, va='bottom')
+
+# Bar widths are shares of the current leader, so the x-axis never rescales
+ax.set_xlim(0, 1.12)
+ax.set_ylim(top_n - 0.45, -0.6)
+ax.set_xticks([0.25, 0.5, 0.75, 1.0])
+ax.tick_params(axis='both', length=0, labelbottom=False, labelleft=False)
+ax.grid(axis='x', linewidth=0.5, color=ECON_LIGHT)
+ax.set_axisbelow(True)
+ax.axvline(x=0, color='#AAAAAA', linewidth=0.8)
+
+# ── Text stamps ──
+class TextSprites:
+    """
+    Pre-rendered text.  Each distinct string is laid out and rasterised once
+    on a small transparent canvas; frames then stamp the cached RGBA pixels
+    with draw_image instead of running text layout for every label again.
+    """
+
+    def __init__(self, **text_kw):
+        self.fig = Figure(figsize=(8, 2), dpi=dpi)
+        self.fig.patch.set_alpha(0)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.text = self.fig.text(0.01, 0.1, '', ha='left', va='bottom', **text_kw)
+        self.canvas.draw()
+        self.blank = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.cache = {}
+
+    def __getitem__(self, s):
+        if s not in self.cache:
+            self.canvas.restore_region(self.blank)
+            self.text.set_text(s)
+            self.fig.draw_artist(self.text)
+            bb = self.text.get_window_extent(self.canvas.get_renderer())
+            # The canvas buffer is top row first; draw_image wants bottom row first
+            buf = np.asarray(self.canvas.buffer_rgba())
+            h = buf.shape[0]
+            self.cache[s] = buf[h - int(np.ceil(bb.y1)):h - int(np.floor(bb.y0)),
+                                int(np.floor(bb.x0)):int(np.ceil(bb.x1))][::-1].copy()
+        return self.cache[s]
+
+
+name_sprites  = TextSprites(fontsize=11, fontweight='bold', fontfamily=body_font,
+                            color=ECON_DARK)
+value_sprites = TextSprites(fontsize=10, fontfamily=body_font, color=ECON_GREY)
+year_sprites  = TextSprites(fontsize=54, fontweight='bold', fontfamily=title_font,
+                            color=ECON_LIGHT)
+
+# ── Animated bars ──
+bars = []
+for i in range(len(shown)):
+    bar = plt.Rectangle((0, 0), 0, 0.72, facecolor=race_colors[i], edgecolor='none')
+    bar.set_animated(True)
+    ax.add_patch(bar)
+    bars.append(bar)
+names = [get_name(codes[idx]) for idx in shown]
+
+canvas = fig.canvas
+canvas.draw()
+background = canvas.copy_from_bbox(fig.bbox)
+renderer = canvas.get_renderer()
+width, height = canvas.get_width_height()
+
+# Pixel anchors: names right-aligned just left of the axes, year bottom-right
+name_x = ax.transAxes.transform((-0.01, 0))[0]
+year_x, year_y = ax.transAxes.transform((0.97, 0.06))
+
+
+def stamp(img, x, y, alpha=1.0):
+    """Draw a cached text image with its bottom-left corner at pixel (x, y)."""
+    gc = renderer.new_gc()
+    gc.set_alpha(alpha)
+    renderer.draw_image(gc, round(x), round(y), img)
+    gc.restore()
+
+
+def draw_frame(k):
+    """Restore the cached background and redraw only the moving bars and labels."""
+    canvas.restore_region(background)
+    share = frame_views[:, k] / frame_lead[k]
+    pos = frame_ranks[:, k]
+    # Rows fade in/out as they cross the last row of the table
+    alpha = np.clip(top_n - pos, 0, 1)
+    y_px = ax.transData.transform(np.column_stack([share + 0.008, pos]))
+    for i in range(len(shown)):
+        a = alpha[i]
+        if a <= 0:
+            continue
+        bars[i].set_bounds(0, pos[i] - 0.36, share[i], 0.72)
+        bars[i].set_alpha(a)
+        fig.draw_artist(bars[i])
+        vx, vy = y_px[i]
+        name = name_sprites[names[i]]
+        stamp(name, name_x - name.shape[1], vy - name.shape[0] / 2, a)
+        value = value_sprites[fmt(frame_views[i, k])]
+        stamp(value, vx, vy - value.shape[0] / 2, a)
+    year = year_sprites[str(frame_year[k])]
+    stamp(year, year_x - year.shape[1], year_y)
+    return np.asarray(canvas.buffer_rgba())
+
+
+# ═══════════════════════════════════════════════════════════
+#  ENCODE
+# ═══════════════════════════════════════════════════════════
+
+t_start = time.perf_counter()
+if not as_gif and not shutil.which('ffmpeg'):
+    sys.exit(f'ffmpeg not found on PATH; install it or pass a .gif path instead of {outpath}')
+if as_gif:
+    from PIL import Image
+    # One fixed palette for every frame: the first frame's colours (background,
+    # text, anti-aliasing) plus every bar colour exactly, including bars that
+    # only enter the table later
+    bar_rgb = [round(v * 255) for c in race_colors[:len(shown)] for v in mcolors.to_rgb(c)]
+    first = Image.fromarray(draw_frame(0)[..., :3]).quantize(colors=256 - len(shown))
+    palette = Image.new('P', (1, 1))
+    palette.putpalette(first.getpalette()[:3 * (256 - len(shown))] + bar_rgb)
+    frames = []
+    for k in range(n_frames):
+        img = Image.fromarray(draw_frame(k)[..., :3])
+        frames.append(img.quantize(palette=palette, dither=Image.Dither.NONE))
+    frames[0].save(outpath, save_all=True, append_images=frames[1:],
+                   duration=round(1000 / fps), loop=0, optimize=False)
+else:
+    ffmpeg = subprocess.Popen(
+        ['ffmpeg', '-y', '-loglevel', 'error',
+         '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps),
+         '-i', '-', '-c:v', 'libx264', '-pix_fmt', 'yuv420p', outpath],
+        stdin=subprocess.PIPE)
+    try:
+        for k in range(n_frames):
+            ffmpeg.stdin.write(draw_frame(k).tobytes())
+        ffmpeg.stdin.close()
+    except BrokenPipeError:
+        pass   # ffmpeg exited early; its status is reported below
+    if ffmpeg.wait() != 0:
+        sys.exit(f'ffmpeg failed writing {outpath}')
+plt.close(fig)
+
+elapsed = time.perf_counter() - t_start
+print(f'✓ Rank race: {n_frames} frames, {duration}s @ {fps}fps → '
+      f'{os.path.basename(outpath)} in {elapsed:.1f}s')
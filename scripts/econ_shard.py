@@ -0,0 +1,208 @@
+"""
+Deterministic sharding of chart outputs across machines.
+
+Each chart script builds its full, ordered list of (output path, render
+function) jobs and hands it to ``run()``.  With ``--shard i/n`` on the
+command line only every n-th job (starting at job i) is rendered and a
+per-shard manifest is written next to the charts:
+
+    python econ_all_langs.py --shard 2/4
+
+Shards are 1-based.  Jobs are dealt round-robin so heavy and light pages
+spread evenly.  Once every shard has run (and its outputs + manifest have
+been copied back), check that together they cover the full set:
+
+    python econ_shard.py merge [manifest_dir] [--verify] [--scripts a,b]
+
+--scripts names the chart scripts whose shards must all be present.
+"""
+import collections
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+CHARTS_DIR   = '../charts'
+MANIFEST_DIR = os.path.join(CHARTS_DIR, 'manifests')
+
+
+def parse_shard(argv=None):
+    """Return (index, count) from ``--shard i/n``, or None when not sharded."""
+    argv = sys.argv[1:] if argv is None else argv
+    for i, arg in enumerate(argv):
+        if arg == '--shard':
+            spec = argv[i + 1] if i + 1 < len(argv) else ''
+        elif arg.startswith('--shard='):
+            spec = arg.split('=', 1)[1]
+        else:
+            continue
+        # A bad or missing spec must never fall back to rendering everything
+        m = re.fullmatch(r'(\d+)/(\d+)', spec)
+        if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+            sys.exit(f'--shard expects i/n with 1 <= i <= n, got {spec!r}')
+        return int(m.group(1)), int(m.group(2))
+    return None
+
+
+def select(jobs, index, count):
+    """This shard's slice of jobs: every count-th job, starting at index."""
+    return jobs[index - 1::count]
+
+
+def sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def manifest_path(script, index, count):
+    return os.path.join(MANIFEST_DIR, f'{script}.shard-{index}-of-{count}.json')
+
+
+def run(script, jobs, argv=None):
+    """
+    Render this process's share of jobs, a list of (outpath, render) pairs
+    where render(outpath) writes one chart.  Without --shard every job runs
+    and no manifest is written.  Returns the (index, count) shard that ran,
+    or None for a full run.
+    """
+    shard = parse_shard(argv)
+    if shard is None:
+        for outpath, render in jobs:
+            render(outpath)
+        return None
+
+    index, count = shard
+    outputs = []
+    t_shard = time.perf_counter()
+    for outpath, render in select(jobs, index, count):
+        t0 = time.perf_counter()
+        render(outpath)
+        outputs.append({
+            'file': os.path.relpath(outpath, CHARTS_DIR),
+            'sha256': sha256(outpath),
+            'seconds': round(time.perf_counter() - t0, 3),
+        })
+
+    manifest = {
+        'script': script,
+        'shard': [index, count],
+        'expected': [os.path.relpath(p, CHARTS_DIR) for p, _ in jobs],
+        'outputs': outputs,
+        'seconds': round(time.perf_counter() - t_shard, 3),
+    }
+    os.makedirs(MANIFEST_DIR, exist_ok=True)
+    path = manifest_path(script, index, count)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    print(f'✓ Shard {index}/{count}: {len(outputs)} of {len(jobs)} outputs → {path}')
+    return shard
+
+
+def merge(manifest_dir=MANIFEST_DIR, verify=False, charts_dir=None, scripts=None):
+    """
+    Check the shard manifests in manifest_dir cover each script's full
+    output set exactly once.  Returns (problems, merged): a list of problems
+    (empty if all good) and the combined manifest per script, which is also
+    written to manifest_dir/merged.json.  With
+    verify, output hashes are checked against the files in charts_dir,
+    which defaults to the manifest directory's parent (the charts/ layout
+    the scripts write).  If scripts is given, any of them with no
+    manifests at all is reported too.
+    """
+    if charts_dir is None:
+        charts_dir = os.path.dirname(os.path.abspath(manifest_dir))
+    by_script = {}
+    for path in sorted(glob.glob(os.path.join(manifest_dir, '*.shard-*-of-*.json'))):
+        with open(path) as f:
+            m = json.load(f)
+        by_script.setdefault(m['script'], []).append(m)
+
+    problems = []
+    if not by_script:
+        problems.append(f'no shard manifests found in {manifest_dir}')
+    for script in sorted(set(scripts or ()) - set(by_script)):
+        problems.append(f'{script}: no shard manifests found in {manifest_dir}')
+    merged = {}
+    for script, shards in sorted(by_script.items()):
+        counts = {m['shard'][1] for m in shards}
+        if len(counts) != 1:
+            problems.append(f'{script}: manifests from different shard counts {sorted(counts)}')
+            continue
+        count = counts.pop()
+        seen = sorted(m['shard'][0] for m in shards)
+        if seen != list(range(1, count + 1)):
+            missing = sorted(set(range(1, count + 1)) - set(seen))
+            problems.append(f'{script}: shards {seen} of {count} present'
+                            + (f', missing {missing}' if missing else ', duplicates'))
+        expected = shards[0]['expected']
+        if any(m['expected'] != expected for m in shards):
+            problems.append(f'{script}: shards disagree on the expected output set')
+
+        outputs = [o for m in sorted(shards, key=lambda m: m['shard'][0])
+                   for o in m['outputs']]
+        files = [o['file'] for o in outputs]
+        dupes = sorted(f for f, c in collections.Counter(files).items() if c > 1)
+        missing = sorted(set(expected) - set(files))
+        extra = sorted(set(files) - set(expected))
+        if dupes:
+            problems.append(f'{script}: rendered more than once: {dupes}')
+        if missing:
+            problems.append(f'{script}: never rendered: {missing}')
+        if extra:
+            problems.append(f'{script}: not in expected set: {extra}')
+
+        if verify:
+            for o in outputs:
+                path = os.path.join(charts_dir, o['file'])
+                if not os.path.exists(path):
+                    problems.append(f'{script}: {o["file"]} not found in {charts_dir}')
+                elif sha256(path) != o['sha256']:
+                    problems.append(f'{script}: {o["file"]} hash does not match manifest')
+
+        position = {f: i for i, f in enumerate(expected)}
+        merged[script] = {
+            'shards': count,
+            'outputs': sorted(outputs, key=lambda o: position.get(o['file'], len(expected))),
+            'seconds': round(sum(m['seconds'] for m in shards), 3),
+        }
+
+    if merged:
+        with open(os.path.join(manifest_dir, 'merged.json'), 'w') as f:
+            json.dump(merged, f, indent=1)
+    return problems, merged
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    usage = 'usage: python econ_shard.py merge [manifest_dir] [--verify] [--scripts a,b]'
+    if not args or args[0] != 'merge':
+        sys.exit(usage)
+    verify, scripts, dirs = False, None, []
+    rest = iter(args[1:])
+    for a in rest:
+        if a == '--verify':
+            verify = True
+        elif a == '--scripts':
+            scripts = next(rest, '')
+        elif a.startswith('--scripts='):
+            scripts = a.split('=', 1)[1]
+        else:
+            dirs.append(a)
+    if scripts is not None:
+        scripts = [x for x in scripts.split(',') if x]
+        if not scripts:
+            sys.exit(usage)
+    problems, merged = merge(dirs[0] if dirs else MANIFEST_DIR, verify=verify, scripts=scripts)
+    for p in problems:
+        print(f'✗ {p}')
+    if problems:
+        sys.exit(1)
+    for script, m in merged.items():
+        print(f'✓ {script}: {len(m["outputs"])} outputs from {m["shards"]} shards')
+    print(f'✓ Shards cover the full output set of: {", ".join(merged)}')